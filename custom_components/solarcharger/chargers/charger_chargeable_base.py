@@ -111,11 +111,11 @@ class ChargerChargeableBase(HaDevice, ScOptionState, Charger, Chargeable):
         state = self.option_get_entity_string(
             ENTITY_CHARGEE_LOCATION_SENSOR, val_dict=val_dict
         )
-        state_list = self.option_get_list(
+        state_set = self.option_get_set(
             OPTION_CHARGEE_LOCATION_STATE_LIST, val_dict=val_dict
         )
-        if state is not None and state_list is not None:
-            is_at_location = state in state_list
+        if state is not None and state_set is not None:
+            is_at_location = state in state_set
 
         return is_at_location
 
@@ -197,11 +197,11 @@ class ChargerChargeableBase(HaDevice, ScOptionState, Charger, Chargeable):
         state = self.option_get_entity_string(
             ENTITY_CHARGER_PLUGGED_IN_SENSOR, val_dict=val_dict
         )
-        state_list = self.option_get_list(
+        state_set = self.option_get_set(
             OPTION_CHARGER_CONNECT_STATE_LIST, val_dict=val_dict
         )
-        if state is not None and state_list is not None:
-            is_connected = state in state_list
+        if state is not None and state_set is not None:
+            is_connected = state in state_set
 
         return is_connected
 
@@ -236,9 +236,9 @@ class ChargerChargeableBase(HaDevice, ScOptionState, Charger, Chargeable):
         state = self.option_get_entity_string(
             ENTITY_CHARGER_CHARGING_SENSOR, val_dict=val_dict
         )
-        state_list = self.option_get_list(OPTION_CHARGER_CHARGING_STATE_LIST)
-        if state is not None and state_list is not None:
-            is_charging = state in state_list
+        state_set = self.option_get_set(OPTION_CHARGER_CHARGING_STATE_LIST)
+        if state is not None and state_set is not None:
+            is_charging = state in state_set
 
         return is_charging
 
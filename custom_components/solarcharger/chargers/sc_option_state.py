@@ -2,7 +2,9 @@
 """SolarCharger entity state using config from config_entry.options and config_subentry."""
 
 import asyncio
+from collections.abc import Container, Hashable
 from datetime import datetime, time
+from functools import lru_cache
 import json
 import logging
 from typing import Any
@@ -80,6 +82,21 @@ from .sc_config_state import ScConfigState
 _LOGGER = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# State list options rarely change, so only parse each JSON string once.
+# The options are free text, so anything other than a list of plain values
+# is logged once and matched directly against the parsed JSON.
+@lru_cache(maxsize=32)
+def _json_to_frozenset(config_item: str, json_str: str) -> frozenset[Any] | None:
+    """Convert JSON list string to frozenset, or None if not a list of plain values."""
+    values = json.loads(json_str)
+    if isinstance(values, list) and all(isinstance(val, Hashable) for val in values):
+        return frozenset(values)
+
+    _LOGGER.warning("%s: Expected JSON list of states, got %s", config_item, json_str)
+    return None
+
+
 # ----------------------------------------------------------------------------
 # ----------------------------------------------------------------------------
 class ScOptionState(ScConfigState):
@@ -392,18 +409,22 @@ class ScOptionState(ScConfigState):
         return str_val
 
     # ----------------------------------------------------------------------------
-    def option_get_list(
+    def option_get_set(
         self,
         config_item: str,
         val_dict: ConfigValueDict | None = None,
-    ) -> list[Any] | None:
-        """Get list from option config data."""
+    ) -> Container[Any] | None:
+        """Get set from option config data, eg. for matching against entity state."""
 
         json_str = self.option_get_string(config_item, val_dict=val_dict)
         if json_str is None:
             return None
 
-        return json.loads(json_str)
+        state_set = _json_to_frozenset(config_item, json_str)
+        if state_set is None:
+            return json.loads(json_str)
+
+        return state_set
 
     # ----------------------------------------------------------------------------
     def option_get_charger_name(self) -> str:
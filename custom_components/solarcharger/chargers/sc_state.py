@@ -29,7 +29,7 @@ from ..const import (
     SOLAR_CHARGER_COORDINATOR_EVENT,
 )
 from ..exceptions.entity_exception import EntityExceptionError
-from ..helpers.utils import get_next_sunrise_time, get_next_sunset_time
+from ..helpers.utils import get_next_sunrise_sunset_times, get_next_sunset_time
 
 # ----------------------------------------------------------------------------
 # ----------------------------------------------------------------------------
@@ -432,8 +432,9 @@ class ScState:
         """Return true if within daylight hours."""
 
         sun_state = self.get_sun_state_or_abort()
-        next_sunrise = get_next_sunrise_time(self.caller, sun_state)
-        next_sunset = get_next_sunset_time(self.caller, sun_state)
+        next_sunrise, next_sunset = get_next_sunrise_sunset_times(
+            self.caller, sun_state
+        )
         return next_sunrise > next_sunset
 
     # ----------------------------------------------------------------------------
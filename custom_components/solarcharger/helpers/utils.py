@@ -4,21 +4,24 @@
 
 import asyncio
 from collections.abc import Callable
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta, tzinfo
+from functools import lru_cache
 import logging
-import threading
 from types import FrameType
 from typing import Any
 
 # import pytz
 from homeassistant.core import CALLBACK_TYPE, State
 from homeassistant.util import slugify
-from homeassistant.util.dt import as_local, parse_datetime
+from homeassistant.util.dt import get_default_time_zone
 
 # ----------------------------------------------------------------------------
 # ----------------------------------------------------------------------------
 _LOGGER = logging.getLogger(__name__)
 
+# Sun travels 180 degrees from sunrise to sunset.
+_INV_180_DEGREES = 1.0 / 180.0
+
 
 # ----------------------------------------------------------------------------
 # General utils
@@ -46,25 +49,17 @@ def get_callable_name(obj: Callable) -> str:
 # ----------------------------------------------------------------------------
 # Threading utils
 # ----------------------------------------------------------------------------
-def is_event_loop_thread():
-    """Check if the current thread is the main event loop thread."""
+def is_event_loop_thread() -> bool:
+    """Check if an event loop is running in the current thread."""
     try:
-        # Get the currently running event loop
-        loop = asyncio.get_running_loop()
-
-        # The main event loop is typically associated with the main thread
-        # You can compare the thread ID of the loop with the current thread
-        # However, directly comparing loop._thread_id is not officially supported
-        # A more robust approach is to check if the loop is the global default loop
-        # and if the current thread is the main thread.
-        return (
-            threading.current_thread() is threading.main_thread()
-            and loop is asyncio.get_event_loop()
-        )
+        # A loop is only running in the thread that is running it.
+        asyncio.get_running_loop()
     except RuntimeError:
         # No event loop is running in the current thread
         return False
 
+    return True
+
 
 # ----------------------------------------------------------------------------
 def log_is_event_loop(
@@ -101,16 +96,18 @@ def log_is_event_loop(
 # Other possible values:
 # state.state = 'above_horizon'
 # ----------------------------------------------------------------------------
+# Sun time strings only change a few times a day, so cache the parsed datetimes.
+@lru_cache(maxsize=16)
 def convert_to_timezone_aware_datetime(utc_str: str) -> datetime:
     """Convert HA UTC time string to timezone-aware datetime object."""
     # Parse into a timezone-aware datetime
     # Time string in UTC, ie. 2025-11-05T08:26:32.189258+00:00
 
-    # dt: datetime = datetime.fromisoformat(utc_str)
-    # convert to UTC explicitly
-    # dt_utc = dt.astimezone(ZoneInfo("UTC"))
-
-    dt_utc: datetime = parse_datetime(utc_str, raise_on_error=True)
+    # fromisoformat() already returns a UTC-aware datetime for the "+00:00" offset,
+    # so there is no need to convert to UTC explicitly.
+    dt_utc: datetime = datetime.fromisoformat(utc_str)
+    if dt_utc.tzinfo is None:
+        dt_utc = dt_utc.replace(tzinfo=UTC)
 
     # HA Local timezone has been set to UTC, ie. dt_utc = dt_localtime
     # dt_localtime = dt_utc.astimezone()
@@ -136,6 +133,20 @@ def get_sun_attribute_or_abort(caller: str, sun_state: State, attrib_name: str)
     return sun_attrib
 
 
+# ----------------------------------------------------------------------------
+def get_sun_attributes_or_abort(
+    caller: str, sun_state: State, *attrib_names: str
+) -> tuple[Any, ...]:
+    """Get multiple sun attributes or abort."""
+    attributes = sun_state.attributes
+    sun_attribs = tuple(attributes.get(attrib_name) for attrib_name in attrib_names)
+    if None in sun_attribs:
+        attrib_name = attrib_names[sun_attribs.index(None)]
+        raise ValueError(f"{caller}: Failed to get sun attribute '{attrib_name}'")
+
+    return sun_attribs
+
+
 # ----------------------------------------------------------------------------
 def get_sun_attribute_time(caller: str, sun_state: State, attrib: str) -> datetime:
     """Get sun time attribute."""
@@ -156,18 +167,41 @@ def get_sun_elevation(caller: str, sun_state: State) -> float:
     return get_sun_attribute_or_abort(caller, sun_state, "elevation")
 
 
+# ----------------------------------------------------------------------------
+# Time zone is part of the key so a change in HA time zone is picked up.
+@lru_cache(maxsize=32)
+def _as_local_cached(utc_time: datetime, time_zone: tzinfo) -> datetime:
+    """Convert UTC time to local timezone."""
+    return utc_time.astimezone(time_zone)
+
+
 # ----------------------------------------------------------------------------
 def get_next_sunrise_time(caller: str, sun_state: State) -> datetime:
     """Get next sunrise time in local timezone."""
     utc_time = get_sun_attribute_time(caller, sun_state, "next_rising")
-    return as_local(utc_time)
+    return _as_local_cached(utc_time, get_default_time_zone())
 
 
 # ----------------------------------------------------------------------------
 def get_next_sunset_time(caller: str, sun_state: State) -> datetime:
     """Get next sunset time in local timezone."""
     utc_time = get_sun_attribute_time(caller, sun_state, "next_setting")
-    return as_local(utc_time)
+    return _as_local_cached(utc_time, get_default_time_zone())
+
+
+# ----------------------------------------------------------------------------
+def get_next_sunrise_sunset_times(
+    caller: str, sun_state: State
+) -> tuple[datetime, datetime]:
+    """Get next sunrise and sunset times in local timezone."""
+    next_rising, next_setting = get_sun_attributes_or_abort(
+        caller, sun_state, "next_rising", "next_setting"
+    )
+    time_zone = get_default_time_zone()
+    return (
+        _as_local_cached(convert_to_timezone_aware_datetime(next_rising), time_zone),
+        _as_local_cached(convert_to_timezone_aware_datetime(next_setting), time_zone),
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -176,20 +210,36 @@ def get_next_sunset_time(caller: str, sun_state: State) -> datetime:
 # Sun elevation degree rate of change varies with day of time and season.
 def get_sec_per_degree_sun_elevation(caller: str, sun_state: State) -> float:
     """Get seconds per degree sun elevation for the today."""
-    next_setting_local = get_next_sunset_time(caller, sun_state)
-    next_rising_local = get_next_sunrise_time(caller, sun_state)
 
-    if next_rising_local > next_setting_local:
+    # Result only changes when the sun's next rising or setting time changes.
+    return _calc_sec_per_degree_sun_elevation(
+        *get_sun_attributes_or_abort(caller, sun_state, "next_rising", "next_setting")
+    )
+
+
+# ----------------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _calc_sec_per_degree_sun_elevation(
+    next_rising_utc_str: str, next_setting_utc_str: str
+) -> float:
+    """Calculate seconds per degree sun elevation from sun UTC time strings."""
+    # Only the difference in time is needed, so stay in UTC.
+    next_setting_utc = convert_to_timezone_aware_datetime(next_setting_utc_str)
+    next_rising_utc = convert_to_timezone_aware_datetime(next_rising_utc_str)
+
+    if next_rising_utc > next_setting_utc:
         # Passed sunrise today
-        from_time = next_rising_local - timedelta(days=1)
-        to_time = next_setting_local
+        from_time = next_rising_utc - timedelta(days=1)
+        to_time = next_setting_utc
     else:
         # Tomorrow
-        from_time = next_rising_local
-        to_time = next_setting_local
+        from_time = next_rising_utc
+        to_time = next_setting_utc
 
-    total_sunlight_seconds = to_time.timestamp() - from_time.timestamp()
-    seconds_per_degree: float = total_sunlight_seconds / 180
+    to_timestamp = to_time.timestamp()
+    from_timestamp = from_time.timestamp()
+    total_sunlight_seconds = to_timestamp - from_timestamp
+    seconds_per_degree: float = total_sunlight_seconds * _INV_180_DEGREES
 
     # sydney_tz = pytz.timezone("Australia/Sydney")
     # next_rising_sydney = next_rising_utc.astimezone(sydney_tz)
@@ -213,28 +263,27 @@ def remove_callback_subscription(
 ) -> CALLBACK_TYPE | None:
     """Remove callback subscription."""
 
-    unsubscribe = unsub_callbacks.get(callback_key)
-    if unsubscribe is not None:
-        _LOGGER.warning("%s: Removed callback: %s", caller, callback_key)
-        unsub_callbacks.pop(callback_key)
-
-        if cancel_subscription:
-            try:
-                unsubscribe()
-            except Exception as e:
-                _LOGGER.exception(
-                    "%s: %s: Failed to unsubscribe callback: %s",
-                    caller,
-                    callback_key,
-                    e,
-                )
-
-    else:
+    unsubscribe = unsub_callbacks.pop(callback_key, None)
+    if unsubscribe is None:
         _LOGGER.debug(
             "%s: Callback not exist for removal: %s",
             caller,
             callback_key,
         )
+        return None
+
+    _LOGGER.debug("%s: Removed callback: %s", caller, callback_key)
+
+    if cancel_subscription:
+        try:
+            unsubscribe()
+        except Exception as e:
+            _LOGGER.exception(
+                "%s: %s: Failed to unsubscribe callback: %s",
+                caller,
+                callback_key,
+                e,
+            )
 
     return unsubscribe
 
@@ -257,7 +306,7 @@ def save_callback_subscription(
     #     )
     remove_callback_subscription(caller, unsub_callbacks, callback_key)
     unsub_callbacks[callback_key] = subscription
-    _LOGGER.warning("%s: Saved callback: %s", caller, callback_key)
+    _LOGGER.debug("%s: Saved callback: %s", caller, callback_key)
 
 
 # ----------------------------------------------------------------------------
@@ -267,8 +316,12 @@ def remove_all_callback_subscriptions(
 ) -> None:
     """Remove all callback subscriptions."""
 
-    for callback_key, unsubscribe in list(unsub_callbacks.items()):
-        _LOGGER.warning("%s: Unsubscribe callback: %s", caller, callback_key)
+    # Clear before unsubscribing, so callbacks that touch the dict see it empty.
+    callbacks = unsub_callbacks.copy()
+    unsub_callbacks.clear()
+
+    for callback_key, unsubscribe in callbacks.items():
+        _LOGGER.debug("%s: Unsubscribe callback: %s", caller, callback_key)
         try:
             unsubscribe()
         except Exception as e:
@@ -276,7 +329,5 @@ def remove_all_callback_subscriptions(
                 "%s: %s: Failed to unsubscribe callback: %s", caller, callback_key, e
             )
 
-    unsub_callbacks.clear()
-
 
 # ----------------------------------------------------------------------------
@@ -1,5 +1,7 @@
 """SolarCharger button platform."""
 
+from __future__ import annotations
+
 from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any
 
@@ -48,6 +50,10 @@ if TYPE_CHECKING:
 class SolarChargerSwitchEntity(SolarChargerEntity, SwitchEntity, RestoreEntity):
     """SolarCharger switch base entity."""
 
+    # Switches start off until the restored or default state is applied.
+    _attr_is_on: bool | None = False
+    _is_restore_state: bool = RESTORE_ON_START_TRUE
+
     def __init__(
         self,
         config_item: str,
@@ -56,7 +62,6 @@ class SolarChargerSwitchEntity(SolarChargerEntity, SwitchEntity, RestoreEntity):
         desc: SwitchEntityDescription,
         coordinator: SolarChargerCoordinator,
         default_val: bool,
-        is_restore_state: bool,
         action: SWITCH_ACTION_TYPE,
     ) -> None:
         """Initialize the SolarCharger switch entity."""
@@ -68,7 +73,6 @@ class SolarChargerSwitchEntity(SolarChargerEntity, SwitchEntity, RestoreEntity):
         # self._attr_has_entity_name = True
         self._coordinator = coordinator
         self._default_val = default_val
-        self._is_restore_state = is_restore_state
         self._action = action
 
     # ----------------------------------------------------------------------------
@@ -127,7 +131,6 @@ class SolarChargerSwitchActionEntity(SolarChargerSwitchEntity):
         desc: SwitchEntityDescription,
         coordinator: SolarChargerCoordinator,
         default_val: bool,
-        is_restore_state: bool,
         action: SWITCH_ACTION_TYPE,
     ) -> None:
         """Initialize the switch."""
@@ -138,7 +141,6 @@ class SolarChargerSwitchActionEntity(SolarChargerSwitchEntity):
             desc,
             coordinator,
             default_val,
-            is_restore_state,
             action,
         )
 
@@ -167,145 +169,144 @@ class SolarChargerSwitchActionEntity(SolarChargerSwitchEntity):
 
 # ----------------------------------------------------------------------------
 # ----------------------------------------------------------------------------
-async def async_setup_entry(
-    hass: core.HomeAssistant,
-    config_entry: config_entries.ConfigEntry,
-    async_add_entities: AddConfigEntryEntitiesCallback,
-    # async_add_entities: Callable,
-) -> None:
-    """Set up buttons based on config entry."""
-    coordinator: SolarChargerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-
-    CONFIG_SWITCH_LIST: tuple[
-        tuple[
-            str,
-            Any,
-            bool,
-            SWITCH_ACTION_TYPE,
-            SolarChargerEntityType,
-            SwitchEntityDescription,
-        ],
-        ...,
-    ] = (
-        #####################################
-        # Control:  entity_category=None
-        # Config:   entity_category=EntityCategory.CONFIG
-        #####################################
-        #####################################
-        # Boolean switches
-        #####################################
-        (
-            SWITCH_REDUCE_CHARGE_LIMIT_DIFFERENCE,
-            SolarChargerSwitchEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_dummy,
-            SolarChargerEntityType.TYPE_LOCALHIDDEN_GLOBAL,
-            SwitchEntityDescription(
-                key=SWITCH_REDUCE_CHARGE_LIMIT_DIFFERENCE,
-                entity_category=EntityCategory.CONFIG,
-            ),
+# Actions are coordinator method names, resolved against the coordinator at setup.
+CONFIG_SWITCH_LIST: tuple[
+    tuple[
+        str,
+        Any,
+        str,
+        SolarChargerEntityType,
+        SwitchEntityDescription,
+    ],
+    ...,
+] = (
+    #####################################
+    # Control:  entity_category=None
+    # Config:   entity_category=EntityCategory.CONFIG
+    #####################################
+    #####################################
+    # Boolean switches
+    #####################################
+    (
+        SWITCH_REDUCE_CHARGE_LIMIT_DIFFERENCE,
+        SolarChargerSwitchEntity,
+        "async_switch_dummy",
+        SolarChargerEntityType.TYPE_LOCALHIDDEN_GLOBAL,
+        SwitchEntityDescription(
+            key=SWITCH_REDUCE_CHARGE_LIMIT_DIFFERENCE,
+            entity_category=EntityCategory.CONFIG,
         ),
-        (
-            SWITCH_FAST_CHARGE_MODE,
-            SolarChargerSwitchEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_dummy,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_FAST_CHARGE_MODE,
-            ),
+    ),
+    (
+        SWITCH_FAST_CHARGE_MODE,
+        SolarChargerSwitchEntity,
+        "async_switch_dummy",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_FAST_CHARGE_MODE,
         ),
-        (
-            SWITCH_POLL_CHARGER_UPDATE,
-            SolarChargerSwitchEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_dummy,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_POLL_CHARGER_UPDATE,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    (
+        SWITCH_POLL_CHARGER_UPDATE,
+        SolarChargerSwitchEntity,
+        "async_switch_dummy",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_POLL_CHARGER_UPDATE,
+            entity_category=EntityCategory.CONFIG,
         ),
-        (
-            SWITCH_END_ON_CONDITION,
-            SolarChargerSwitchEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_dummy,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_END_ON_CONDITION,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    (
+        SWITCH_END_ON_CONDITION,
+        SolarChargerSwitchEntity,
+        "async_switch_dummy",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_END_ON_CONDITION,
+            entity_category=EntityCategory.CONFIG,
         ),
-        #####################################
-        # Action switches - calls coordinator to perform action
-        #####################################
-        (
-            SWITCH_SCHEDULE_CHARGE,
-            SolarChargerSwitchActionEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_schedule_charge,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_SCHEDULE_CHARGE,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    #####################################
+    # Action switches - calls coordinator to perform action
+    #####################################
+    (
+        SWITCH_SCHEDULE_CHARGE,
+        SolarChargerSwitchActionEntity,
+        "async_switch_schedule_charge",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_SCHEDULE_CHARGE,
+            entity_category=EntityCategory.CONFIG,
         ),
-        (
-            SWITCH_PLUGIN_TRIGGER,
-            SolarChargerSwitchActionEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_plugin_trigger,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_PLUGIN_TRIGGER,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    (
+        SWITCH_PLUGIN_TRIGGER,
+        SolarChargerSwitchActionEntity,
+        "async_switch_plugin_trigger",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_PLUGIN_TRIGGER,
+            entity_category=EntityCategory.CONFIG,
         ),
-        (
-            SWITCH_PRESENCE_TRIGGER,
-            SolarChargerSwitchActionEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_presence_trigger,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_PRESENCE_TRIGGER,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    (
+        SWITCH_PRESENCE_TRIGGER,
+        SolarChargerSwitchActionEntity,
+        "async_switch_presence_trigger",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_PRESENCE_TRIGGER,
+            entity_category=EntityCategory.CONFIG,
         ),
-        (
-            SWITCH_SUN_TRIGGER,
-            SolarChargerSwitchActionEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_sun_elevation_trigger,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_SUN_TRIGGER,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    (
+        SWITCH_SUN_TRIGGER,
+        SolarChargerSwitchActionEntity,
+        "async_switch_sun_elevation_trigger",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_SUN_TRIGGER,
+            entity_category=EntityCategory.CONFIG,
         ),
-        (
-            SWITCH_CHARGE,
-            SolarChargerSwitchActionEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_charge,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_CHARGE,
-            ),
+    ),
+    (
+        SWITCH_CHARGE,
+        SolarChargerSwitchActionEntity,
+        "async_switch_charge",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_CHARGE,
         ),
-        (
-            SWITCH_CALIBRATE_MAX_CHARGE_SPEED,
-            SolarChargerSwitchActionEntity,
-            RESTORE_ON_START_TRUE,
-            coordinator.async_switch_calibrate_max_charge_speed,
-            SolarChargerEntityType.TYPE_LOCAL,
-            SwitchEntityDescription(
-                key=SWITCH_CALIBRATE_MAX_CHARGE_SPEED,
-                entity_category=EntityCategory.CONFIG,
-            ),
+    ),
+    (
+        SWITCH_CALIBRATE_MAX_CHARGE_SPEED,
+        SolarChargerSwitchActionEntity,
+        "async_switch_calibrate_max_charge_speed",
+        SolarChargerEntityType.TYPE_LOCAL,
+        SwitchEntityDescription(
+            key=SWITCH_CALIBRATE_MAX_CHARGE_SPEED,
+            entity_category=EntityCategory.CONFIG,
         ),
-    )
+    ),
+)
+
+
+# ----------------------------------------------------------------------------
+# ----------------------------------------------------------------------------
+async def async_setup_entry(
+    hass: core.HomeAssistant,
+    config_entry: config_entries.ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    # async_add_entities: Callable,
+) -> None:
+    """Set up buttons based on config entry."""
+    coordinator: SolarChargerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    # Bind coordinator actions once and share them across subentries.
+    actions: dict[str, SWITCH_ACTION_TYPE] = {
+        action_name: getattr(coordinator, action_name)
+        for _, _, action_name, _, _ in CONFIG_SWITCH_LIST
+    }
 
     for subentry in config_entry.subentries.values():
         # For global defaults and charger subentries
@@ -314,8 +315,7 @@ async def async_setup_entry(
         for (
             config_item,
             cls,
-            is_restore_state,
-            action,
+            action_name,
             entity_type,
             entity_description,
         ) in CONFIG_SWITCH_LIST:
@@ -327,8 +327,7 @@ async def async_setup_entry(
                     entity_description,
                     coordinator,
                     get_device_config_default_value(subentry, config_item),
-                    is_restore_state,
-                    action,
+                    actions[action_name],
                 )
 
         if len(switches) > 0:
@@ -66,7 +66,18 @@ class SolarChargerTimeEntity(SolarChargerEntity, TimeEntity, RestoreEntity):
         if (
             last_state := await self.async_get_last_state()
         ) is not None and last_state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            await self.async_set_value(time.fromisoformat(last_state.state))
+            # Set value directly, HA writes the state once entity has been added.
+            try:
+                self._attr_native_value = time.fromisoformat(last_state.state)
+            except ValueError as e:
+                # Keep the default value.
+                _LOGGER.error(
+                    "%s: %s: Unable to restore time %s: %s",
+                    self._subentry.unique_id,
+                    self._entity_key,
+                    last_state.state,
+                    e,
+                )
 
 
 # ----------------------------------------------------------------------------
@@ -188,6 +199,19 @@ CONFIG_TIME_LIST: tuple[
     #####################################
 )
 
+# CONFIG_TIME_LIST grouped by entity type, so that is_create_entity() only needs
+# to be checked once per entity type for each subentry.
+CONFIG_TIME_BY_ENTITY_TYPE: dict[
+    SolarChargerEntityType, tuple[tuple[str, TimeEntityDescription], ...]
+] = {
+    entity_type: tuple(
+        (config_item, entity_description)
+        for config_item, item_type, entity_description in CONFIG_TIME_LIST
+        if item_type == entity_type
+    )
+    for entity_type in dict.fromkeys(item[1] for item in CONFIG_TIME_LIST)
+}
+
 
 # ----------------------------------------------------------------------------
 async def async_setup_entry(
@@ -198,21 +222,30 @@ async def async_setup_entry(
     """Set up times based on config entry."""
     coordinator: SolarChargerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
+    # Build all entities first, then add them per subentry in one pass.
+    subentry_times: dict[str, dict[str, SolarChargerTimeConfigEntity]] = {}
+
     for subentry in config_entry.subentries.values():
         # For both global default and charger subentries
-        times: dict[str, SolarChargerTimeConfigEntity] = {}
-        for config_item, entity_type, entity_description in CONFIG_TIME_LIST:
-            if is_create_entity(subentry, entity_type):
-                times[config_item] = SolarChargerTimeConfigEntity(
-                    config_item, subentry, entity_type, entity_description
-                )
+        # Keyed by config item, coordinator looks up the weekday end time by key.
+        times: dict[str, SolarChargerTimeConfigEntity] = {
+            config_item: SolarChargerTimeConfigEntity(
+                config_item, subentry, entity_type, entity_description
+            )
+            for entity_type, config_items in CONFIG_TIME_BY_ENTITY_TYPE.items()
+            if is_create_entity(subentry, entity_type)
+            for config_item, entity_description in config_items
+        }
 
         if len(times) > 0:
             coordinator.device_controls[
                 subentry.subentry_id
             ].controller.charge_control.entities.times = times
-            async_add_entities(
-                times.values(),
-                update_before_add=False,
-                config_subentry_id=subentry.subentry_id,
-            )
+            subentry_times[subentry.subentry_id] = times
+
+    for subentry_id, times in subentry_times.items():
+        async_add_entities(
+            list(times.values()),
+            update_before_add=False,
+            config_subentry_id=subentry_id,
+        )
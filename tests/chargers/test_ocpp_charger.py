@@ -7,18 +7,33 @@ from homeassistant.config_entries import ConfigSubentryData
 from homeassistant.helpers.device_registry import DeviceEntry
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.solarcharger.chargers.ocpp_charger import (
-    OcppCharger,
-    OcppEntityMap,
-    OcppStatusMap,
-)
-from custom_components.solarcharger.const import CHARGER_DOMAIN_OCPP
-from custom_components.solarcharger.config_subentry_flow import (
+from custom_components.solarcharger.chargers.ocpp_charger import OcppCharger
+from custom_components.solarcharger.const import (
+    DOMAIN_OCPP,
+    ENTITY_CHARGER_CHARGING_SENSOR,
+    ENTITY_CHARGER_GET_CHARGE_CURRENT,
+    ENTITY_CHARGER_PLUGGED_IN_SENSOR,
+    ENTITY_OCPP_CHARGER_ID,
+    ENTITY_OCPP_TRANSACTION_ID,
+    NUMBER_CHARGER_MAX_CURRENT,
+    OCPP_CHARGING_STATE,
+    OPTION_CHARGER_CHARGING_STATE_LIST,
+    OPTION_CHARGER_CONNECT_STATE_LIST,
+    SUBENTRY_CHARGER_DEVICE_DOMAIN,
+    SUBENTRY_CHARGER_DEVICE_ID,
+    SUBENTRY_CHARGER_DEVICE_NAME,
     SUBENTRY_TYPE_CHARGER,
-    SUBENTRY_DEVICE_DOMAIN,
-    SUBENTRY_DEVICE_NAME,
-    SUBENTRY_CHARGER_DEVICE,
 )
+from tests.helpers.mock_states import make_state_map
+
+pytestmark = pytest.mark.timeout(1, func_only=True)
+
+SUBENTRY_UNIQUE_ID = "ocpp_testcharger"
+STATUS_CONNECTOR = "sensor.charger_status_connector"
+CURRENT_IMPORT = "sensor.charger_current_import"
+MAX_CURRENT = "number.solarcharger_ocpp_testcharger_charger_max_current"
+CHARGER_ID = "sensor.charger_id"
+TRANSACTION_ID = "sensor.charger_transaction_id"
 
 
 @pytest.fixture
@@ -27,28 +42,46 @@ def mock_hass():
     hass = MagicMock()
     hass.services = MagicMock()
     hass.services.async_call = AsyncMock()
+    hass.states.get.return_value = None
     return hass
 
 
 @pytest.fixture
-def mock_config_entry():
+def connect_state_list():
+    """Connect state list option, overridden by tests with parametrize."""
+    return '["Preparing", "Charging", "SuspendedEV", "SuspendedEVSE", "Finishing"]'
+
+
+@pytest.fixture
+def mock_config_entry(connect_state_list):
     """Create a mock ConfigEntry for the tests."""
     return MockConfigEntry(
         domain="solarcharger",
         title="OCPP Test Charger",
-        data={"charger_type": "ocpp"},
         unique_id="test_ocpp_charger",
+        options={
+            SUBENTRY_UNIQUE_ID: {
+                ENTITY_CHARGER_PLUGGED_IN_SENSOR: STATUS_CONNECTOR,
+                OPTION_CHARGER_CONNECT_STATE_LIST: connect_state_list,
+                ENTITY_CHARGER_CHARGING_SENSOR: STATUS_CONNECTOR,
+                OPTION_CHARGER_CHARGING_STATE_LIST: '["Charging", "SuspendedEV", "SuspendedEVSE"]',
+                NUMBER_CHARGER_MAX_CURRENT: MAX_CURRENT,
+                ENTITY_CHARGER_GET_CHARGE_CURRENT: CURRENT_IMPORT,
+                ENTITY_OCPP_CHARGER_ID: CHARGER_ID,
+                ENTITY_OCPP_TRANSACTION_ID: TRANSACTION_ID,
+            }
+        },
         subentries_data=[
             ConfigSubentryData(
                 data={
-                    SUBENTRY_DEVICE_DOMAIN: "ocpp",
-                    SUBENTRY_DEVICE_NAME: "MockOcppCharger",
-                    SUBENTRY_CHARGER_DEVICE: "MockOcppDeviceId",
+                    SUBENTRY_CHARGER_DEVICE_DOMAIN: DOMAIN_OCPP,
+                    SUBENTRY_CHARGER_DEVICE_NAME: "MockOcppCharger",
+                    SUBENTRY_CHARGER_DEVICE_ID: "MockOcppDeviceId",
                 },
                 subentry_id="MockSubentryId1",
                 subentry_type=SUBENTRY_TYPE_CHARGER,
                 title="ocpp TestCharger",
-                unique_id="ocpp_testcharger",
+                unique_id=SUBENTRY_UNIQUE_ID,
             )
         ],
     )
@@ -69,16 +102,24 @@ def ocpp_charger(mock_hass, mock_config_entry, mock_device_entry):
     with patch(
         "custom_components.solarcharger.chargers.ocpp_charger.OcppCharger.refresh_entities"
     ):
-        charger = OcppCharger(
+        return OcppCharger(
             hass=mock_hass,
-            config_entry=mock_config_entry,
-            config_subentry=next(iter(mock_config_entry.subentries.values())),
-            device_entry=mock_device_entry,
+            entry=mock_config_entry,
+            subentry=next(iter(mock_config_entry.subentries.values())),
+            device=mock_device_entry,
         )
-        # Mock the _get_entity_state_by_key method
-        charger._get_entity_state_by_key = MagicMock()
-        # charger._get_entity_state_by_unique_id = MagicMock()
-        return charger
+
+
+@pytest.fixture
+def charging_states(ocpp_charger):
+    """Entity states for an OCPP charger that is charging."""
+    return {
+        STATUS_CONNECTOR: OCPP_CHARGING_STATE,
+        CHARGER_ID: "sn123456789",
+        TRANSACTION_ID: "42",
+        ocpp_charger.ocpp_profile_id_entity_id: "1",
+        ocpp_charger.ocpp_profile_stack_level_entity_id: "0",
+    }
 
 
 def test_is_charger_device():
@@ -94,50 +135,65 @@ def test_is_charger_device():
     assert OcppCharger.is_charger_device(other_device) is False
 
 
-async def test_set_charge_current(ocpp_charger, mock_hass):
+async def test_set_charge_current(ocpp_charger, mock_hass, charging_states):
     """Test setting current limits on the OCPP charger."""
     # Setup test data
     limit = 14
+    mock_hass.states.get.side_effect = make_state_map(charging_states)
 
     # Call the method
-    await ocpp_charger.set_charge_current(limit)
+    result = await ocpp_charger.async_set_charge_current(limit)
 
     # Verify service call was made with correct parameters
-    mock_hass.services.async_call.assert_called_once_with(
-        domain=CHARGER_DOMAIN_OCPP,
-        service="set_charge_rate",
-        service_data={
-            "device_id": "test_device_id",
-            "limit_amps": 14,  # Should use minimum of the values
-        },
-        blocking=True,
-    )
+    assert result == 14
+    mock_hass.services.async_call.assert_called_once()
+    kwargs = mock_hass.services.async_call.call_args.kwargs
+    assert kwargs["domain"] == DOMAIN_OCPP
+    assert kwargs["service"] == "set_charge_rate"
+    service_data = kwargs["service_data"]
+    assert service_data["devid"] == "sn123456789"
+    assert service_data["custom_profile"]["transactionId"] == 42
+    assert service_data["custom_profile"]["chargingProfileId"] == 1
+    assert service_data["custom_profile"]["stackLevel"] == 0
+    assert service_data["custom_profile"]["chargingSchedule"][
+        "chargingSchedulePeriod"
+    ] == [{"startPeriod": 0, "limit": 14}]
+
+
+async def test_set_charge_current_not_charging(ocpp_charger, mock_hass):
+    """Test setting current limits when the charger is not charging."""
+    mock_hass.states.get.side_effect = make_state_map({STATUS_CONNECTOR: "Available"})
+
+    # Call the method
+    result = await ocpp_charger.async_set_charge_current(14)
 
+    # Verify no service call was made
+    assert result == 0
+    mock_hass.services.async_call.assert_not_called()
 
-async def test_set_charge_current_service_error(ocpp_charger, mock_hass):
+
+async def test_set_charge_current_service_error(
+    ocpp_charger, mock_hass, charging_states
+):
     """Test setting current limits when service call fails."""
     # Setup test data
     limit = 14
+    mock_hass.states.get.side_effect = make_state_map(charging_states)
 
     # Mock service call to raise an error
     mock_hass.services.async_call.side_effect = ValueError("Service error")
 
     # Call the method - should not raise an exception
-    await ocpp_charger.set_charge_current(limit)
+    await ocpp_charger.async_set_charge_current(limit)
 
     # Verify service call was attempted
     mock_hass.services.async_call.assert_called_once()
 
 
-def test_get_charge_current_success_from_offered(ocpp_charger):
-    """Test retrieving the current limit from Current.Offered."""
-    # Mock the entity state to return maximum_current
-    def mock_entity_state(key):
-        if key == OcppEntityMap.MaximumCurrent:
-            return "16.5"
-        return None
-
-    ocpp_charger._get_entity_state_by_key.side_effect = mock_entity_state
+def test_get_charge_current_success(ocpp_charger, mock_hass):
+    """Test retrieving the charge current from Current.Import."""
+    # Mock the entity state to return the import current
+    mock_hass.states.get.side_effect = make_state_map({CURRENT_IMPORT: "16.5"})
 
     # Call the method
     result = ocpp_charger.get_charge_current()
@@ -148,8 +204,7 @@ def test_get_charge_current_success_from_offered(ocpp_charger):
 
 def test_get_charge_current_missing_entity(ocpp_charger):
     """Test retrieving the current limit when no entities are available."""
-    # Mock the entity state to return None for all entities
-    ocpp_charger._get_entity_state_by_key.return_value = None
+    # No entity states are set, so hass.states.get returns None
 
     # Call the method
     result = ocpp_charger.get_charge_current()
@@ -158,10 +213,10 @@ def test_get_charge_current_missing_entity(ocpp_charger):
     assert result is None
 
 
-def test_get_charge_current_invalid_value(ocpp_charger):
+def test_get_charge_current_invalid_value(ocpp_charger, mock_hass):
     """Test retrieving the current limit with invalid value."""
     # Mock the entity state to return an invalid value
-    ocpp_charger._get_entity_state_by_key.return_value = "invalid"
+    mock_hass.states.get.side_effect = make_state_map({CURRENT_IMPORT: "invalid"})
 
     # Call the method
     result = ocpp_charger.get_charge_current()
@@ -170,138 +225,138 @@ def test_get_charge_current_invalid_value(ocpp_charger):
     assert result is None
 
 
-def test_get_max_charge_current_default(ocpp_charger):
-    """Test retrieving the max current limit with default value."""
-    # Mock the entity state to return None
-    ocpp_charger._get_entity_state_by_key.return_value = None
+def test_get_max_charge_current(ocpp_charger, mock_hass):
+    """Test retrieving the max current limit from the max current entity."""
+    # Mock the entity state to return the max current
+    mock_hass.states.get.side_effect = make_state_map({MAX_CURRENT: "15"})
 
     # Call the method
     result = ocpp_charger.get_max_charge_current()
 
-    # Verify results - should return default 32A
+    # Verify results
     assert result == 15
 
 
-def test_car_connected_true(ocpp_charger):
-    """Test car_connected returns True for valid statuses."""
-    for status in [
-        OcppStatusMap.Preparing,
-        OcppStatusMap.Charging,
-        OcppStatusMap.SuspendedEVSE,
-        OcppStatusMap.SuspendedEV,
-        OcppStatusMap.Finishing,
-    ]:
-        # Mock the status from connector status
-        def mock_entity_state(key):
-            if key == OcppEntityMap.StatusConnector:
-                return status
-            return None
-
-        ocpp_charger._get_entity_state_by_key.side_effect = mock_entity_state
-
-        # Call the method
-        result = ocpp_charger.car_connected()
-
-        # Verify results
-        assert result is True
-
-
-def test_car_connected_false(ocpp_charger):
-    """Test car_connected returns False for invalid statuses."""
-    for status in [
-        OcppStatusMap.Available,
-        OcppStatusMap.Reserved,
-        OcppStatusMap.Unavailable,
-        OcppStatusMap.Faulted,
+@pytest.mark.parametrize(
+    "status",
+    [
+        "Preparing",
+        "Charging",
+        "SuspendedEVSE",
+        "SuspendedEV",
+        "Finishing",
+    ],
+)
+def test_is_connected_true(ocpp_charger, mock_hass, status):
+    """Test is_connected returns True for valid statuses."""
+    # Mock the status from connector status
+    mock_hass.states.get.side_effect = make_state_map({STATUS_CONNECTOR: status})
+
+    # Call the method
+    result = ocpp_charger.is_connected()
+
+    # Verify results
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        "Available",
+        "Reserved",
+        "Unavailable",
+        "Faulted",
         None,  # Test with no status
-    ]:
-        # Mock the status
-        def mock_entity_state(key):
-            if key == OcppEntityMap.StatusConnector:
-                return status
-            return None
-
-        ocpp_charger._get_entity_state_by_key.side_effect = mock_entity_state
-
-        # Call the method
-        result = ocpp_charger.car_connected()
-
-        # Verify results
-        assert result is False
-
-
-def test_can_charge_true(ocpp_charger):
-    """Test can_charge returns True for valid statuses."""
-    for status in [
-        OcppStatusMap.Preparing,
-        OcppStatusMap.Charging,
-        OcppStatusMap.SuspendedEV,
-    ]:
-        # Mock the status
-        def mock_entity_state(key):
-            if key == OcppEntityMap.StatusConnector:
-                return status
-            return None
-
-        ocpp_charger._get_entity_state_by_key.side_effect = mock_entity_state
-
-        # Call the method
-        result = ocpp_charger.can_charge()
-
-        # Verify results
-        assert result is True
-
-
-def test_can_charge_false(ocpp_charger):
-    """Test can_charge returns False for invalid statuses."""
-    for status in [
-        OcppStatusMap.Available,
-        OcppStatusMap.SuspendedEVSE,
-        OcppStatusMap.Finishing,
-        OcppStatusMap.Reserved,
-        OcppStatusMap.Unavailable,
-        OcppStatusMap.Faulted,
+    ],
+)
+def test_is_connected_false(ocpp_charger, mock_hass, status):
+    """Test is_connected returns False for invalid statuses."""
+    # Mock the status from connector status
+    mock_hass.states.get.side_effect = make_state_map({STATUS_CONNECTOR: status})
+
+    # Call the method
+    result = ocpp_charger.is_connected()
+
+    # Verify results
+    assert result is False
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        "Charging",
+        "SuspendedEV",
+        "SuspendedEVSE",
+    ],
+)
+def test_is_charging_true(ocpp_charger, mock_hass, status):
+    """Test is_charging returns True for valid statuses."""
+    # Mock the status from connector status
+    mock_hass.states.get.side_effect = make_state_map({STATUS_CONNECTOR: status})
+
+    # Call the method
+    result = ocpp_charger.is_charging()
+
+    # Verify results
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        "Available",
+        "Preparing",
+        "Finishing",
+        "Reserved",
+        "Unavailable",
+        "Faulted",
         None,  # Test with no status
-    ]:
-        # Mock the status
-        def mock_entity_state(key):
-            if key == OcppEntityMap.StatusConnector:
-                return status
-            return None
+    ],
+)
+def test_is_charging_false(ocpp_charger, mock_hass, status):
+    """Test is_charging returns False for invalid statuses."""
+    # Mock the status from connector status
+    mock_hass.states.get.side_effect = make_state_map({STATUS_CONNECTOR: status})
+
+    # Call the method
+    result = ocpp_charger.is_charging()
+
+    # Verify results
+    assert result is False
 
-        ocpp_charger._get_entity_state_by_key.side_effect = mock_entity_state
 
-        # Call the method
-        result = ocpp_charger.can_charge()
+@pytest.mark.parametrize(
+    ("connect_state_list", "expected"),
+    [
+        ('[["Charging"]]', False),  # Nested list never matches
+        ('"Preparing, Charging"', True),  # Bare string matches by substring
+    ],
+)
+def test_is_connected_bad_state_list(ocpp_charger, mock_hass, expected):
+    """Test is_connected with a connect state list that is not a list of states."""
+    # Mock the status from connector status
+    mock_hass.states.get.side_effect = make_state_map({STATUS_CONNECTOR: "Charging"})
 
-        # Verify results
-        assert result is False
+    # Call the method - should not raise an exception
+    result = ocpp_charger.is_connected()
 
+    # Verify results
+    assert result is expected
 
-def test_status_fallback(ocpp_charger):
-    """Test that status falls back from connector to general status."""
-    # Mock connector status as None, general status as Available
-    def mock_entity_state(key):
-        if key == OcppEntityMap.StatusConnector:
-            raise ValueError("Connector status not available")
-        elif key == OcppEntityMap.Status:
-            return OcppStatusMap.Available
-        return None
 
-    ocpp_charger._get_entity_state_by_key.side_effect = mock_entity_state
+def test_status_unavailable(ocpp_charger, mock_hass):
+    """Test that is_connected is False when the connector status cannot be read."""
+    # Connector status raises when read
+    mock_hass.states.get.side_effect = ValueError("Connector status not available")
 
-    # Call car_connected which uses _get_status
-    result = ocpp_charger.car_connected()
+    # Call the method
+    result = ocpp_charger.is_connected()
 
-    # Should be False since Available is not in connected statuses
+    # Should be False since the connector status cannot be read
     assert result is False
 
-    # Verify both entities were queried
-    expected_calls = [
-        call(OcppEntityMap.StatusConnector),
-        call(OcppEntityMap.Status),
-    ]
-    ocpp_charger._get_entity_state_by_key.assert_has_calls(expected_calls)
+    # Verify the connector status was queried
+    mock_hass.states.get.assert_has_calls([call(STATUS_CONNECTOR)])
 
 
 async def test_async_unload(ocpp_charger):
@@ -1,5 +1,7 @@
 """Test helpers for Solar Charger."""
 
+from types import SimpleNamespace
+
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from custom_components.solarcharger.chargers.charger import Charger
@@ -17,8 +19,8 @@ class MockCharger(Charger):
         # Skip the parent class initialization to avoid needing HomeAssistant, etc.
         # This is safe for testing but wouldn't work in production
         self.hass = None
-        self.config_entry = type('ConfigEntry', (), {'entry_id': charger_id})()
-        self.device = type('DeviceEntry', (), {'id': device_id})()
+        self.config_entry = SimpleNamespace(entry_id=charger_id)
+        self.device = SimpleNamespace(id=device_id)
 
         # Charger state
         self._current_limit = initial_current
@@ -0,0 +1,13 @@
+"""State helpers for Solar Charger tests."""
+
+from homeassistant.core import State
+
+
+def make_state_map(mapping):
+    """Return a hass.states.get side effect that looks up states in mapping."""
+    states = {
+        entity_id: State(entity_id, state)
+        for entity_id, state in mapping.items()
+        if state is not None
+    }
+    return states.get
@@ -1,20 +1,14 @@
 """Test the Simple Integration config flow."""
 
+from homeassistant.config_entries import ConfigSubentryData
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.solarcharger import (
-    config_flow as cf,
-)
-from custom_components.solarcharger import (
-    const,
-)
-from custom_components.solarcharger import (
-    config_options_flow as of,
-)
+from custom_components.solarcharger import const
 
 
 @pytest.mark.asyncio
+@pytest.mark.timeout(5)
 async def test_options_flow_init(hass):
     """Test we get the form."""
 
@@ -22,8 +16,22 @@ async def test_options_flow_init(hass):
         domain=const.DOMAIN,
         unique_id="MockSolarCharger",
         data={
-            cf.CONF_CHARGER_DEVICE: "abc-123",
+            const.CONFIG_NET_POWER_SENSOR: "sensor.net_power",
+            const.CONFIG_CHARGER_CURRENT_UPDATE_PERIOD: const.DEFAULT_CHARGER_CURRENT_UPDATE_PERIOD,
         },
+        subentries_data=[
+            ConfigSubentryData(
+                data={
+                    const.SUBENTRY_CHARGER_DEVICE_DOMAIN: const.DOMAIN_OCPP,
+                    const.SUBENTRY_CHARGER_DEVICE_NAME: "MockOcppCharger",
+                    const.SUBENTRY_CHARGER_DEVICE_ID: "MockOcppDeviceId",
+                },
+                subentry_id="MockSubentryId1",
+                subentry_type=const.SUBENTRY_TYPE_CHARGER,
+                title="ocpp TestCharger",
+                unique_id="ocpp_testcharger",
+            )
+        ],
     )
     config_entry.add_to_hass(hass)
 
@@ -32,4 +40,7 @@ async def test_options_flow_init(hass):
     assert result["type"] == "form"
     assert result["step_id"] == "init"
     assert result["errors"] == {}
-    assert of.OPTION_CHARGER_EFFECTIVE_VOLTAGE in result["data_schema"].schema
+    assert const.OPTION_SELECT_SETTINGS in result["data_schema"].schema
+    assert result["data_schema"].schema[const.OPTION_SELECT_SETTINGS].config[
+        "options"
+    ] == [const.OPTION_GLOBAL_DEFAULTS_ID, "ocpp_testcharger"]